@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import heapq
 import json
 import pathlib
 import sys
@@ -16,6 +18,7 @@ from pto.optimizer import (
     MultiGroupPlan,
     Plan,
     PTOOptimizer,
+    VacationBlock,
     format_calendar_view,
     format_multi_group_calendar_view,
     format_multi_group_plan,
@@ -32,8 +35,13 @@ app = typer.Typer(
 STRATEGY_CHOICES = ["all", "bridges", "longest", "weekends", "quarterly"]
 
 
+@functools.lru_cache(maxsize=512)
 def _parse_date(value: str) -> datetime.date:
-    """Parse a YYYY-MM-DD date string."""
+    """Parse a YYYY-MM-DD date string.
+
+    Cached: multi-group configs often repeat the same holiday dates
+    across groups. Failed parses raise and are never cached.
+    """
     try:
         return datetime.date.fromisoformat(value)
     except ValueError:
@@ -44,6 +52,19 @@ def _current_year() -> int:
     return datetime.date.today().year
 
 
+def _merge_unique_sorted(*runs: list[datetime.date]) -> list[datetime.date]:
+    """Merge already-sorted date runs into one sorted, de-duplicated list.
+
+    Presets come out of :func:`get_holidays` sorted, so a linear merge
+    beats re-sorting the concatenation.
+    """
+    merged: list[datetime.date] = []
+    for d in heapq.merge(*runs):
+        if not merged or d != merged[-1]:
+            merged.append(d)
+    return merged
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -137,15 +158,27 @@ def optimize(
         "--config",
         help="Path to JSON config file for multi-group optimization.",
     ),
+    config_json: str | None = typer.Option(
+        None,
+        "--config-json",
+        help="Inline JSON config for multi-group optimization (alternative to --config).",
+    ),
 ) -> None:
     """Optimize your PTO placement for maximum time off.
 
-    Use --budget for single-person mode, or --config for multi-group
-    (family / friends) mode.
+    Use --budget for single-person mode, or --config / --config-json for
+    multi-group (family / friends) mode.
     """
     # --- Multi-group mode ---
-    if config is not None:
-        _run_multi_group(config, year, strategy, calendar, output_json)
+    if config is not None or config_json is not None:
+        if config is not None and config_json is not None:
+            typer.echo("Error: Use either --config or --config-json, not both.", err=True)
+            raise typer.Exit(code=1)
+        if config is not None:
+            data = _load_config(config)
+        else:
+            data = _parse_config(config_json, "--config-json")  # type: ignore[arg-type]
+        _run_multi_group(data, year, strategy, calendar, output_json)
         return
 
     # --- Single-group mode (original behaviour) ---
@@ -164,7 +197,7 @@ def optimize(
 
     # Collect holidays
     holidays: list[datetime.date] = []
-    holiday_names: dict[tuple[int, int], str] = {}
+    holiday_names: dict[datetime.date, str] = {}
 
     if country and country != "none":
         try:
@@ -174,15 +207,11 @@ def optimize(
             raise typer.Exit(code=1) from None
         for d, name in preset:
             holidays.append(d)
-            holiday_names[(d.month, d.day)] = name
+            holiday_names[d] = name
 
-    if holiday:
-        for h in holiday:
-            d = _parse_date(h)
-            holidays.append(d)
-
-    # Deduplicate and sort
-    holidays = sorted(set(holidays))
+    # Preset dates are already sorted; merge in the user-supplied extras.
+    extras = sorted({_parse_date(h) for h in holiday}) if holiday else []
+    holidays = _merge_unique_sorted(holidays, extras)
 
     # Parse heuristic dates
     pinned_dates = [_parse_date(d) for d in pin] if pin else []
@@ -230,34 +259,50 @@ def _print_text(
     plans: list[Plan],
     optimizer: PTOOptimizer,
     holidays: list[datetime.date],
-    holiday_names: dict[tuple[int, int], str],
+    holiday_names: dict[datetime.date, str],
     year: int,
     budget: int,
     floating: int,
     show_calendar: bool,
 ) -> None:
     w = 64
-    typer.echo("=" * w)
-    typer.echo("  PTO VACATION OPTIMIZER")
-    typer.echo("=" * w)
-    typer.echo(f"  Year:              {year}")
-    typer.echo(f"  PTO budget:        {budget} days")
-    typer.echo(f"  Floating holidays: {floating}")
-    typer.echo(f"  Company holidays:  {len(holidays)}")
-    typer.echo()
+    lines: list[str] = []
+    lines.append("=" * w)
+    lines.append("  PTO VACATION OPTIMIZER")
+    lines.append("=" * w)
+    lines.append(f"  Year:              {year}")
+    lines.append(f"  PTO budget:        {budget} days")
+    lines.append(f"  Floating holidays: {floating}")
+    lines.append(f"  Company holidays:  {len(holidays)}")
+    lines.append("")
     for h in holidays:
-        name = holiday_names.get((h.month, h.day), h.strftime("%b %d"))
-        typer.echo(f"    {h.strftime('%a, %b %d'):>12}  {name}")
+        name = holiday_names.get(h) or h.strftime("%b %d")
+        lines.append(f"    {h.strftime('%a, %b %d'):>12}  {name}")
 
     for plan in plans:
-        typer.echo(format_plan(plan, optimizer))
+        lines.append(format_plan(plan, optimizer))
         if show_calendar:
-            typer.echo(format_calendar_view(plan, optimizer))
+            lines.append(format_calendar_view(plan, optimizer))
 
-    typer.echo()
-    typer.echo("=" * w)
-    typer.echo(f"  Generated {len(plans)} vacation plan option{'s' if len(plans) != 1 else ''}.")
-    typer.echo("=" * w)
+    lines.append("")
+    lines.append("=" * w)
+    lines.append(f"  Generated {len(plans)} vacation plan option{'s' if len(plans) != 1 else ''}.")
+    lines.append("=" * w)
+
+    # One write instead of one per line
+    typer.echo("\n".join(lines))
+
+
+def _serialize_block(b: VacationBlock) -> dict[str, object]:
+    """JSON-ready dict for one vacation block (shared by both output modes).
+
+    ``_asdict`` walks the namedtuple fields in C instead of six attribute
+    loads per block; only the two date fields need patching afterwards.
+    """
+    d: dict[str, object] = b._asdict()
+    d["start_date"] = b.start_date.isoformat()
+    d["end_date"] = b.end_date.isoformat()
+    return d
 
 
 def _print_json(plans: list[Plan], optimizer: PTOOptimizer) -> None:
@@ -267,19 +312,9 @@ def _print_json(plans: list[Plan], optimizer: PTOOptimizer) -> None:
             "description": plan.description,
             "pto_dates": [d.isoformat() for d in plan.pto_dates],
             "floating_dates": [d.isoformat() for d in plan.floating_dates],
-            "blocks": [
-                {
-                    "start_date": b.start_date.isoformat(),
-                    "end_date": b.end_date.isoformat(),
-                    "total_days": b.total_days,
-                    "pto_days": b.pto_days,
-                    "holidays": b.holidays,
-                    "weekend_days": b.weekend_days,
-                }
-                for b in plan.blocks
-            ],
+            "blocks": [_serialize_block(b) for b in plan.blocks],
             "summary": {
-                "total_vacation_days": sum(b.total_days for b in plan.blocks),
+                "total_vacation_days": plan.total_vacation_days,
                 "total_pto_used": len(plan.pto_dates) + len(plan.floating_dates),
             },
         }
@@ -290,7 +325,8 @@ def _print_json(plans: list[Plan], optimizer: PTOOptimizer) -> None:
         "floating_holidays": optimizer.floating_holidays,
         "plans": [_serialize_plan(p) for p in plans],
     }
-    json.dump(output, sys.stdout, indent=2)
+    # One buffered write beats json.dump's chunked writes to stdout
+    sys.stdout.write(json.dumps(output, indent=2))
     typer.echo()
 
 
@@ -306,14 +342,21 @@ def _load_config(path: str) -> dict[str, object]:
         typer.echo(f"Error: Config file not found: {path}", err=True)
         raise typer.Exit(code=1)
 
+    return _parse_config(p.read_text(), "config file")
+
+
+def _parse_config(text: str, source: str) -> dict[str, object]:
+    """Parse and validate multi-group config JSON from *source*."""
     try:
-        data = json.loads(p.read_text())
+        data = json.loads(text)
     except json.JSONDecodeError as exc:
-        typer.echo(f"Error: Invalid JSON in config file: {exc}", err=True)
+        typer.echo(f"Error: Invalid JSON in {source}: {exc}", err=True)
         raise typer.Exit(code=1) from None
 
     if not isinstance(data, dict) or "groups" not in data:
-        typer.echo("Error: Config file must contain a 'groups' key.", err=True)
+        typer.echo(
+            f"Error: {source[0].upper()}{source[1:]} must contain a 'groups' key.", err=True
+        )
         raise typer.Exit(code=1)
 
     return data  # type: ignore[return-value]
@@ -327,6 +370,9 @@ def _build_groups(data: dict[str, object], resolved_year: int) -> list[HolidayGr
         typer.echo("Error: 'groups' must be a non-empty list.", err=True)
         raise typer.Exit(code=1)
 
+    # Resolve each distinct country preset once, not once per group.
+    preset_cache: dict[str, tuple[tuple[datetime.date, str], ...]] = {}
+
     for i, raw in enumerate(raw_groups):
         name = raw.get("name", f"Group {i + 1}")
         pto_budget = int(raw.get("pto_budget", 0))
@@ -337,18 +383,19 @@ def _build_groups(data: dict[str, object], resolved_year: int) -> list[HolidayGr
         # Load preset holidays for this group
         country = raw.get("country", None)
         if country and country != "none":
-            try:
-                preset = get_holidays(country, resolved_year)
-            except KeyError as exc:
-                typer.echo(f"Error in group {name!r}: {exc}", err=True)
-                raise typer.Exit(code=1) from None
+            preset = preset_cache.get(country)
+            if preset is None:
+                try:
+                    preset = get_holidays(country, resolved_year)
+                except KeyError as exc:
+                    typer.echo(f"Error in group {name!r}: {exc}", err=True)
+                    raise typer.Exit(code=1) from None
+                preset_cache[country] = preset
             holidays.extend(d for d, _n in preset)
 
-        # Extra custom holidays
-        for h in raw.get("holidays", []):
-            holidays.append(_parse_date(h))
-
-        holidays = sorted(set(holidays))
+        # Extra custom holidays, merged into the sorted preset dates
+        extras = sorted({_parse_date(h) for h in raw.get("holidays", [])})
+        holidays = _merge_unique_sorted(holidays, extras)
 
         groups.append(
             HolidayGroup(
@@ -363,13 +410,13 @@ def _build_groups(data: dict[str, object], resolved_year: int) -> list[HolidayGr
 
 
 def _run_multi_group(
-    config_path: str,
+    data: dict[str, object],
     year_override: int | None,
     strategy: str,
     show_calendar: bool,
     output_json: bool,
 ) -> None:
-    """Execute multi-group optimization from a config file."""
+    """Execute multi-group optimization from parsed config data."""
     if strategy not in STRATEGY_CHOICES:
         typer.echo(
             f"Error: Invalid strategy {strategy!r}. Choose from: {', '.join(STRATEGY_CHOICES)}",
@@ -377,7 +424,6 @@ def _run_multi_group(
         )
         raise typer.Exit(code=1)
 
-    data = _load_config(config_path)
     resolved_year = (
         year_override if year_override is not None else int(data.get("year", _current_year()))  # type: ignore[arg-type]
     )
@@ -407,28 +453,32 @@ def _print_multi_group_text(
     show_calendar: bool,
 ) -> None:
     w = 64
-    typer.echo("=" * w)
-    typer.echo("  PTO VACATION OPTIMIZER (Multi-Group)")
-    typer.echo("=" * w)
-    typer.echo(f"  Year: {year}")
-    typer.echo(f"  Groups: {len(optimizer.groups)}")
-    typer.echo()
+    lines: list[str] = []
+    lines.append("=" * w)
+    lines.append("  PTO VACATION OPTIMIZER (Multi-Group)")
+    lines.append("=" * w)
+    lines.append(f"  Year: {year}")
+    lines.append(f"  Groups: {len(optimizer.groups)}")
+    lines.append("")
 
     for g in optimizer.groups:
         budget_label = f"{g.pto_budget} PTO"
         if g.floating_holidays:
             budget_label += f" + {g.floating_holidays} floating"
-        typer.echo(f"    {g.name}: {budget_label}, {len(g.holidays)} holidays")
+        lines.append(f"    {g.name}: {budget_label}, {len(g.holidays)} holidays")
 
     for plan in plans:
-        typer.echo(format_multi_group_plan(plan, optimizer))
+        lines.append(format_multi_group_plan(plan, optimizer))
         if show_calendar:
-            typer.echo(format_multi_group_calendar_view(plan, optimizer))
+            lines.append(format_multi_group_calendar_view(plan, optimizer))
 
-    typer.echo()
-    typer.echo("=" * w)
-    typer.echo(f"  Generated {len(plans)} vacation plan option{'s' if len(plans) != 1 else ''}.")
-    typer.echo("=" * w)
+    lines.append("")
+    lines.append("=" * w)
+    lines.append(f"  Generated {len(plans)} vacation plan option{'s' if len(plans) != 1 else ''}.")
+    lines.append("=" * w)
+
+    # One write instead of one per line
+    typer.echo("\n".join(lines))
 
 
 def _print_multi_group_json(plans: list[MultiGroupPlan], optimizer: MultiGroupOptimizer) -> None:
@@ -436,17 +486,7 @@ def _print_multi_group_json(plans: list[MultiGroupPlan], optimizer: MultiGroupOp
         return {
             "name": plan.name,
             "description": plan.description,
-            "blocks": [
-                {
-                    "start_date": b.start_date.isoformat(),
-                    "end_date": b.end_date.isoformat(),
-                    "total_days": b.total_days,
-                    "pto_days": b.pto_days,
-                    "holidays": b.holidays,
-                    "weekend_days": b.weekend_days,
-                }
-                for b in plan.blocks
-            ],
+            "blocks": [_serialize_block(b) for b in plan.blocks],
             "group_allocations": [
                 {
                     "group_name": a.group_name,
@@ -457,7 +497,7 @@ def _print_multi_group_json(plans: list[MultiGroupPlan], optimizer: MultiGroupOp
                 for a in plan.group_allocations
             ],
             "summary": {
-                "total_shared_vacation_days": sum(b.total_days for b in plan.blocks),
+                "total_shared_vacation_days": plan.total_vacation_days,
                 "total_pto_across_groups": sum(
                     len(a.pto_dates) + len(a.floating_dates) for a in plan.group_allocations
                 ),
@@ -477,7 +517,8 @@ def _print_multi_group_json(plans: list[MultiGroupPlan], optimizer: MultiGroupOp
         ],
         "plans": [_serialize(p) for p in plans],
     }
-    json.dump(output, sys.stdout, indent=2)
+    # One buffered write beats json.dump's chunked writes to stdout
+    sys.stdout.write(json.dumps(output, indent=2))
     typer.echo()
 
 
@@ -8,7 +8,9 @@ the following Monday.
 
 from __future__ import annotations
 
+import calendar
 import datetime
+import functools
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -24,17 +26,13 @@ def _nth_weekday(year: int, month: int, weekday: int, n: int) -> datetime.date:
     first = datetime.date(year, month, 1)
     # Days until the first target weekday
     delta = (weekday - first.weekday()) % 7
-    first_occurrence = first + datetime.timedelta(days=delta)
-    return first_occurrence + datetime.timedelta(weeks=n - 1)
+    # Ordinal arithmetic skips the two timedelta allocations
+    return datetime.date.fromordinal(first.toordinal() + delta + 7 * (n - 1))
 
 
 def _last_weekday(year: int, month: int, weekday: int) -> datetime.date:
     """Return the last occurrence of *weekday* in *month* of *year*."""
-    # Start from the last day of the month
-    if month == 12:
-        last = datetime.date(year, 12, 31)
-    else:
-        last = datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)
+    last = datetime.date(year, month, calendar.monthrange(year, month)[1])
     delta = (last.weekday() - weekday) % 7
     return last - datetime.timedelta(days=delta)
 
@@ -57,20 +55,28 @@ PRESETS: dict[str, str] = {
 }
 
 
-def us_holidays(year: int) -> list[tuple[datetime.date, str]]:
-    """US federal holidays (observed) for *year*."""
-    return sorted(
-        [
-            (_observed(datetime.date(year, 1, 1)), "New Year's Day"),
-            (_nth_weekday(year, 1, 0, 3), "Martin Luther King Jr. Day"),
-            (_nth_weekday(year, 2, 0, 3), "Presidents' Day"),
-            (_last_weekday(year, 5, 0), "Memorial Day"),
-            (_observed(datetime.date(year, 6, 19)), "Juneteenth"),
-            (_observed(datetime.date(year, 7, 4)), "Independence Day"),
-            (_nth_weekday(year, 9, 0, 1), "Labor Day"),
-            (_nth_weekday(year, 11, 3, 4), "Thanksgiving"),
-            (_observed(datetime.date(year, 12, 25)), "Christmas Day"),
-        ]
+@functools.lru_cache(maxsize=32)
+def us_holidays(year: int) -> tuple[tuple[datetime.date, str], ...]:
+    """US federal holidays (observed) for *year*.
+
+    Results are cached per year: the CLI asks for the same preset several
+    times (single-group optimize, once per group in multi-group mode, and
+    the ``holidays`` command), and the observed-date math never changes.
+    """
+    return tuple(
+        sorted(
+            [
+                (_observed(datetime.date(year, 1, 1)), "New Year's Day"),
+                (_nth_weekday(year, 1, 0, 3), "Martin Luther King Jr. Day"),
+                (_nth_weekday(year, 2, 0, 3), "Presidents' Day"),
+                (_last_weekday(year, 5, 0), "Memorial Day"),
+                (_observed(datetime.date(year, 6, 19)), "Juneteenth"),
+                (_observed(datetime.date(year, 7, 4)), "Independence Day"),
+                (_nth_weekday(year, 9, 0, 1), "Labor Day"),
+                (_nth_weekday(year, 11, 3, 4), "Thanksgiving"),
+                (_observed(datetime.date(year, 12, 25)), "Christmas Day"),
+            ]
+        )
     )
 
 
@@ -79,9 +85,10 @@ _PRESET_FNS: dict[str, type[object] | object] = {
 }
 
 
-def get_holidays(country: str, year: int) -> list[tuple[datetime.date, str]]:
+def get_holidays(country: str, year: int) -> tuple[tuple[datetime.date, str], ...]:
     """Return ``(date, name)`` pairs for the given *country* preset and *year*.
 
+    The result is an immutable (cached) tuple — copy before mutating.
     Raises ``KeyError`` if the country is not supported.
     """
     fn = _PRESET_FNS.get(country)
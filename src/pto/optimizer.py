@@ -15,12 +15,15 @@ Strategies:
 
 from __future__ import annotations
 
+import bisect
 import calendar
 import datetime
+import functools
+import itertools
 import math
+import sys
 from collections.abc import Callable, Iterable
-from functools import cache
-from typing import NamedTuple
+from typing import NamedTuple, TypeVar
 
 # ---------------------------------------------------------------------------
 # Data types
@@ -47,6 +50,16 @@ class Plan(NamedTuple):
     pto_dates: list[datetime.date]
     floating_dates: list[datetime.date]
 
+    @property
+    def total_vacation_days(self) -> int:
+        """Total off-days across all blocks."""
+        return sum(b.total_days for b in self.blocks)
+
+    @property
+    def longest_block_days(self) -> int:
+        """Length of the longest block, or 0 when there are none."""
+        return max((b.total_days for b in self.blocks), default=0)
+
 
 class HolidayGroup(NamedTuple):
     """A group with its own holiday calendar and PTO budget.
@@ -76,6 +89,16 @@ class MultiGroupPlan(NamedTuple):
     blocks: list[VacationBlock]
     group_allocations: list[GroupAllocation]
 
+    @property
+    def total_vacation_days(self) -> int:
+        """Total shared off-days across all blocks."""
+        return sum(b.total_days for b in self.blocks)
+
+    @property
+    def longest_block_days(self) -> int:
+        """Length of the longest block, or 0 when there are none."""
+        return max((b.total_days for b in self.blocks), default=0)
+
 
 # ---------------------------------------------------------------------------
 # Optimizer
@@ -87,6 +110,49 @@ ValueFn = Callable[[int, int], float]
 streak_position is 1 for the first off-day in a streak, 2 for the second, etc.
 """
 
+_PlanT = TypeVar("_PlanT")
+
+# Strategy method names in presentation order, shared by both optimizers'
+# generate_all_plans; a module constant avoids rebuilding the dispatch
+# list (and its bound-method tuples) on every call.
+_STRATEGY_METHODS = (
+    "optimize_max_bridges",
+    "optimize_longest_vacation",
+    "optimize_extended_weekends",
+    "optimize_quarterly",
+)
+
+
+def _streak_value(_d: int, s: int) -> float:
+    """Linear streak reward: a block of length L sums to L*(L+1)/2."""
+    return float(s)
+
+
+def _extended_weekend_value(_d: int, s: int) -> float:
+    """Linear reward up to 4-day streaks, heavy penalty beyond."""
+    if s <= 4:
+        return float(s)
+    return s - 10.0 * (s - 4)
+
+
+def _memoize_plan(method: Callable[..., _PlanT]) -> Callable[..., _PlanT]:
+    """Cache a strategy's plan on the optimizer instance.
+
+    Optimizer configuration is fixed at construction, so each strategy is
+    deterministic per instance; running `--strategy X` after
+    generate_all_plans (or vice versa) reuses the solved plan.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: object) -> _PlanT:
+        cache = self.__dict__.setdefault("_plan_cache", {})
+        name = method.__name__
+        if name not in cache:
+            cache[name] = method(self)
+        return cache[name]
+
+    return wrapper
+
 
 class PTOOptimizer:
     """Optimizes PTO placement to maximize vacation duration through bridging.
@@ -117,7 +183,7 @@ class PTOOptimizer:
     ):
         self.year = year
         self.pto_budget = pto_budget
-        self.holidays = set(holidays)
+        self.holidays = frozenset(holidays)
         self.floating_holidays = floating_holidays
 
         # Heuristic options
@@ -132,11 +198,21 @@ class PTOOptimizer:
         self.end_date = datetime.date(year, 12, 31)
         self.num_days = (self.end_date - self.start_date).days + 1
 
+        # Ordinal arithmetic: one fromordinal call per day, no timedelta
+        # objects, and an integer base for date -> day-index conversions
+        self._start_ord = self.start_date.toordinal()
         self.dates: list[datetime.date] = [
-            self.start_date + datetime.timedelta(days=d) for d in range(self.num_days)
+            datetime.date.fromordinal(self._start_ord + d) for d in range(self.num_days)
+        ]
+        # Weekday cycles with period 7, so one modular sweep replaces a
+        # .weekday() call per day.
+        start_weekday = self.start_date.weekday()
+        self.is_weekend: list[bool] = [(start_weekday + d) % 7 >= 5 for d in range(self.num_days)]
+        # Integer-ordinal membership: hashing an int beats hashing a date
+        _hol_ords = frozenset(h.toordinal() for h in self.holidays)
+        self.is_holiday: list[bool] = [
+            (self._start_ord + d) in _hol_ords for d in range(self.num_days)
         ]
-        self.is_weekend: list[bool] = [d.weekday() >= 5 for d in self.dates]
-        self.is_holiday: list[bool] = [d in self.holidays for d in self.dates]
         self.is_natural_off: list[bool] = [
             w or h for w, h in zip(self.is_weekend, self.is_holiday, strict=True)
         ]
@@ -146,6 +222,14 @@ class PTOOptimizer:
         self._is_blackout: list[bool] = [d in self.blackout_dates for d in self.dates]
         self._month_of: list[int] = [d.month for d in self.dates]
 
+        # Prefix sums so block counters are O(1) range differences
+        self._holiday_prefix: list[int] = list(itertools.accumulate(self.is_holiday, initial=0))
+        self._weekend_prefix: list[int] = list(itertools.accumulate(self.is_weekend, initial=0))
+
+    def day_index(self, d: datetime.date) -> int:
+        """Index of *d* in :attr:`dates` (ordinal subtraction, no timedelta)."""
+        return d.toordinal() - self._start_ord
+
     # ------------------------------------------------------------------
     # Core DP solver
     # ------------------------------------------------------------------
@@ -177,6 +261,7 @@ class PTOOptimizer:
         value_fn: ValueFn,
         pto_budget: int | None = None,
         float_budget: int | None = None,
+        day_range: tuple[int, int] | None = None,
     ) -> tuple[list[int], list[int]]:
         """Find optimal PTO placement using dynamic programming.
 
@@ -189,6 +274,11 @@ class PTOOptimizer:
             Override the default PTO budget.
         float_budget : int, optional
             Override the default floating-holiday budget.
+        day_range : (first_day, last_day), optional
+            Restrict the DP to an inclusive day-index window (e.g. one
+            quarter).  The streak entering the window is seeded with the
+            natural-off run immediately before it, so early-window days
+            are valued at their true streak positions.
 
         Returns
         -------
@@ -204,6 +294,13 @@ class PTOOptimizer:
         is_pinned = self._is_pinned
         is_blackout = self._is_blackout
 
+        first_day, last_day = day_range if day_range is not None else (0, num_days - 1)
+        start_streak = 0
+        i = first_day - 1
+        while i >= 0 and natural_off[i]:
+            start_streak += 1
+            i -= 1
+
         # Heuristic flags
         use_gap = self.min_gap_days > 0
         min_gap = self.min_gap_days
@@ -225,7 +322,7 @@ class PTOOptimizer:
 
         # Build pinned set (workdays only — weekends/holidays are already off)
         pinned_set: set[int] = set()
-        for d in range(num_days):
+        for d in range(first_day, last_day + 1):
             if is_pinned[d] and not natural_off[d]:
                 pinned_set.add(d)
 
@@ -237,6 +334,17 @@ class PTOOptimizer:
         p_budget -= pin_from_pto
         f_budget -= pin_from_float
 
+        # Nothing to place: skip the DP entirely (zero-budget runs are a
+        # common CLI invocation and the answer is always "no PTO days").
+        if p_budget == 0 and f_budget == 0 and not pinned_set:
+            return [], []
+
+        # One indexed lookup per DP state instead of a set hash: pinned
+        # days behave exactly like natural off-days inside the solver.
+        off_or_pinned = natural_off.copy()
+        for d in pinned_set:
+            off_or_pinned[d] = True
+
         # ---- DP with optional gap / monthly-cap state ---------------------
         # State: (day, p_rem, f_rem, streak, gap_cooldown, month_used)
         #   gap_cooldown: workdays remaining before PTO is allowed again
@@ -246,8 +354,11 @@ class PTOOptimizer:
         # when the corresponding heuristic is enabled.
 
         if use_gap or use_cap:
-            # Extended DP with extra state dimensions
+            # Extended DP with extra state dimensions.  As in the fast path,
+            # the winning action is recorded per workday state so the
+            # backtrack replays the table instead of re-evaluating options.
             memo: dict[tuple, float] = {}
+            action_of: dict[tuple, str] = {}
 
             def dp_ext(
                 day: int,
@@ -257,7 +368,7 @@ class PTOOptimizer:
                 gap_cd: int,
                 m_used: int,
             ) -> float:
-                if day >= num_days:
+                if day > last_day:
                     return 0.0
                 key = (day, p_rem, f_rem, streak, gap_cd, m_used)
                 if key in memo:
@@ -268,7 +379,7 @@ class PTOOptimizer:
                     m_used = 0
 
                 # Pinned days: budget already reserved, treat like free off-day
-                if natural_off[day] or day in pinned_set:
+                if off_or_pinned[day]:
                     ns = streak + 1
                     val = value_fn(day, ns) + dp_ext(day + 1, p_rem, f_rem, ns, gap_cd, m_used)
                     memo[key] = val
@@ -290,6 +401,7 @@ class PTOOptimizer:
                 work_gap = new_gap if streak == 0 else (min_gap if use_gap else 0)
                 best = dp_ext(day + 1, p_rem, f_rem, 0, work_gap, m_used)
 
+                act = "work"
                 if can_take:
                     ns = streak + 1
                     incr = value_fn(day, ns)
@@ -299,27 +411,32 @@ class PTOOptimizer:
                         v = incr + dp_ext(day + 1, p_rem - 1, f_rem, ns, 0, next_m)
                         if v > best:
                             best = v
+                            act = "pto"
                     if f_rem > 0:
                         v = incr + dp_ext(day + 1, p_rem, f_rem - 1, ns, 0, next_m)
                         if v > best:
                             best = v
+                            act = "float"
 
                 memo[key] = best
+                action_of[key] = act
                 return best
 
-            dp_ext(0, p_budget, f_budget, 0, 0, 0)
+            dp_ext(first_day, p_budget, f_budget, start_streak, 0, 0)
 
-            # Backtrack
+            # Backtrack by replaying the recorded actions.  State updates
+            # mirror the forward transitions exactly (keys are formed with
+            # the pre-reset month counter, as in dp_ext).
             pto_days: list[int] = []
             float_days: list[int] = []
-            day, p_rem, f_rem, streak = 0, p_budget, f_budget, 0
+            day, p_rem, f_rem, streak = first_day, p_budget, f_budget, start_streak
             gap_cd, m_used = 0, 0
 
-            while day < num_days:
+            while day <= last_day:
+                key = (day, p_rem, f_rem, streak, gap_cd, m_used)
                 if use_cap and day > 0 and month_of[day] != month_of[day - 1]:
                     m_used = 0
 
-                # Pinned days: record as PTO/float (budget already reserved)
                 if natural_off[day]:
                     streak += 1
                     day += 1
@@ -332,79 +449,78 @@ class PTOOptimizer:
                     else:
                         pto_days.append(day)
                     streak += 1
-                    gap_cd = 0
                     day += 1
                     continue
 
-                new_gap = max(0, gap_cd - 1) if use_gap else 0
-
-                can_take = True
-                if is_blackout[day]:
-                    can_take = False
-                if use_gap and gap_cd > 0 and streak == 0:
-                    can_take = False
-                if use_cap and m_used >= monthly_cap:
-                    can_take = False
-
-                work_gap = new_gap if streak == 0 else (min_gap if use_gap else 0)
-
-                work_val = dp_ext(day + 1, p_rem, f_rem, 0, work_gap, m_used)
-                best_val = work_val
-                action = "work"
-
-                if can_take:
-                    ns = streak + 1
-                    incr = value_fn(day, ns)
-                    next_m = m_used + 1
-
-                    if p_rem > 0:
-                        v = incr + dp_ext(day + 1, p_rem - 1, f_rem, ns, 0, next_m)
-                        if v > best_val:
-                            best_val = v
-                            action = "pto"
-                    if f_rem > 0:
-                        v = incr + dp_ext(day + 1, p_rem, f_rem - 1, ns, 0, next_m)
-                        if v > best_val:
-                            best_val = v
-                            action = "float"
+                action = action_of[key]
 
                 if action == "pto":
                     pto_days.append(day)
                     p_rem -= 1
-                    streak = streak + 1
+                    streak += 1
                     gap_cd = 0
                     m_used += 1
                 elif action == "float":
                     float_days.append(day)
                     f_rem -= 1
-                    streak = streak + 1
+                    streak += 1
                     gap_cd = 0
                     m_used += 1
                 else:
-                    gap_cd = work_gap if streak == 0 else (min_gap if use_gap else 0)
+                    new_gap = max(0, gap_cd - 1) if use_gap else 0
+                    gap_cd = new_gap if streak == 0 else (min_gap if use_gap else 0)
                     streak = 0
 
                 day += 1
 
-            memo.clear()
             return pto_days, float_days
 
         # ---- Simple DP (no gap / monthly-cap — original fast path) --------
-        @cache
+        # Explicit dict memo instead of functools.cache: the memo dies with
+        # this call (no cache retained between solves), and recording the
+        # winning action per workday state makes the backtrack a pure table
+        # walk — the iterative-table formulation's main benefit, without
+        # materialising the mostly-unreachable full state space.
+        memo2: dict[tuple[int, int, int, int], float] = {}
+        best_action: dict[tuple[int, int, int, int], str] = {}
+
+        # Jump table over runs of free off-days (natural off or pinned):
+        # free_run_end[d] is one past the last consecutive free day starting
+        # at d, so a whole weekend or holiday cluster costs one recursive
+        # call instead of one per day.
+        free_run_end: list[int] = [0] * (last_day + 2)
+        free_run_end[last_day + 1] = last_day + 1
+        for d in range(last_day, first_day - 1, -1):
+            free_run_end[d] = free_run_end[d + 1] if off_or_pinned[d] else d
+
         def dp(day: int, p_rem: int, f_rem: int, streak: int) -> float:
-            if day >= num_days:
+            if day > last_day:
                 return 0.0
-
-            # Pinned days: budget already reserved, treat like free off-day
-            if natural_off[day] or day in pinned_set:
-                ns = streak + 1
-                return value_fn(day, ns) + dp(day + 1, p_rem, f_rem, ns)
+            key = (day, p_rem, f_rem, streak)
+            cached = memo2.get(key)
+            if cached is not None:
+                return cached
+
+            # Pinned days: budget already reserved, treat like free off-day.
+            # Jump the whole free run in one step.
+            if off_or_pinned[day]:
+                end = free_run_end[day]
+                val = dp(end, p_rem, f_rem, streak + (end - day))
+                s = streak
+                for d2 in range(day, end):
+                    s += 1
+                    val += value_fn(d2, s)
+                memo2[key] = val
+                return val
 
             # Blackout: only work
             if is_blackout[day]:
-                return dp(day + 1, p_rem, f_rem, 0)
+                val = dp(day + 1, p_rem, f_rem, 0)
+                memo2[key] = val
+                return val
 
             best = dp(day + 1, p_rem, f_rem, 0)  # work
+            act = "work"
 
             ns = streak + 1
             incr = value_fn(day, ns)
@@ -413,24 +529,28 @@ class PTOOptimizer:
                 v = incr + dp(day + 1, p_rem - 1, f_rem, ns)
                 if v > best:
                     best = v
+                    act = "pto"
 
             if f_rem > 0:
                 v = incr + dp(day + 1, p_rem, f_rem - 1, ns)
                 if v > best:
                     best = v
+                    act = "float"
 
+            memo2[key] = best
+            best_action[key] = act
             return best
 
-        # Forward pass — compute optimal value (populates cache)
-        dp(0, p_budget, f_budget, 0)
+        # Forward pass — compute optimal value (populates memo + actions)
+        dp(first_day, p_budget, f_budget, start_streak)
 
-        # Backtrack to recover the optimal actions
+        # Backtrack by replaying the recorded actions
         pto_days = []
         float_days = []
 
-        day, p_rem, f_rem, streak = 0, p_budget, f_budget, 0
+        day, p_rem, f_rem, streak = first_day, p_budget, f_budget, start_streak
 
-        while day < num_days:
+        while day <= last_day:
             if natural_off[day]:
                 streak += 1
                 day += 1
@@ -451,39 +571,21 @@ class PTOOptimizer:
                 day += 1
                 continue
 
-            ns = streak + 1
-            incr = value_fn(day, ns)
-
-            work_val = dp(day + 1, p_rem, f_rem, 0)
-            best_val = work_val
-            action = "work"
-
-            if p_rem > 0:
-                v = incr + dp(day + 1, p_rem - 1, f_rem, ns)
-                if v > best_val:
-                    best_val = v
-                    action = "pto"
-
-            if f_rem > 0:
-                v = incr + dp(day + 1, p_rem, f_rem - 1, ns)
-                if v > best_val:
-                    best_val = v
-                    action = "float"
+            action = best_action[(day, p_rem, f_rem, streak)]
 
             if action == "pto":
                 pto_days.append(day)
                 p_rem -= 1
-                streak = ns
+                streak += 1
             elif action == "float":
                 float_days.append(day)
                 f_rem -= 1
-                streak = ns
+                streak += 1
             else:
                 streak = 0
 
             day += 1
 
-        dp.cache_clear()
         return pto_days, float_days
 
     # ------------------------------------------------------------------
@@ -497,46 +599,49 @@ class PTOOptimizer:
         pto_idx: list[int],
         float_idx: list[int],
     ) -> Plan:
-        off_set = set()
-        for d in range(self.num_days):
-            if self.is_natural_off[d] or d in set(pto_idx) or d in set(float_idx):
-                off_set.add(d)
+        # Day-indexed off mask: copy the natural-off mask, then flip the
+        # handful of chosen PTO/floating days
+        off_mask = self.is_natural_off.copy()
+        for i in pto_idx:
+            off_mask[i] = True
+        for i in float_idx:
+            off_mask[i] = True
 
-        blocks = self._extract_blocks(off_set, set(pto_idx), set(float_idx))
+        blocks = self._extract_blocks(off_mask, set(pto_idx), set(float_idx))
 
+        dates = self.dates
         return Plan(
             name=name,
             description=description,
             blocks=blocks,
-            pto_dates=[self.dates[i] for i in pto_idx],
-            floating_dates=[self.dates[i] for i in float_idx],
+            pto_dates=[dates[i] for i in pto_idx],
+            floating_dates=[dates[i] for i in float_idx],
         )
 
     def _extract_blocks(
         self,
-        off_set: set[int],
+        off_mask: list[bool],
         pto_set: set[int],
         float_set: set[int],
     ) -> list[VacationBlock]:
-        if not off_set:
-            return []
-
-        sorted_off = sorted(off_set)
+        # Single pass over the day-indexed mask — no sort, no set lookups
         blocks: list[VacationBlock] = []
-        start = prev = sorted_off[0]
-
-        for d in sorted_off[1:]:
-            if d == prev + 1:
-                prev = d
-            else:
-                blk = self._make_block(start, prev, pto_set, float_set)
+        start: int | None = None
+
+        for d, off in enumerate(off_mask):
+            if off:
+                if start is None:
+                    start = d
+            elif start is not None:
+                blk = self._make_block(start, d - 1, pto_set, float_set)
                 if blk.pto_days > 0:
                     blocks.append(blk)
-                start = prev = d
+                start = None
 
-        blk = self._make_block(start, prev, pto_set, float_set)
-        if blk.pto_days > 0:
-            blocks.append(blk)
+        if start is not None:
+            blk = self._make_block(start, self.num_days - 1, pto_set, float_set)
+            if blk.pto_days > 0:
+                blocks.append(blk)
 
         return blocks
 
@@ -547,27 +652,30 @@ class PTOOptimizer:
         pto_set: set[int],
         float_set: set[int],
     ) -> VacationBlock:
-        rng = range(start, end + 1)
+        # Holiday/weekend counts are prefix-sum differences; PTO counts walk
+        # the (budget-sized) index sets rather than every day in the block
         return VacationBlock(
             start_date=self.dates[start],
             end_date=self.dates[end],
             total_days=end - start + 1,
-            pto_days=sum(1 for d in rng if d in pto_set or d in float_set),
-            holidays=sum(1 for d in rng if self.is_holiday[d]),
-            weekend_days=sum(1 for d in rng if self.is_weekend[d]),
+            pto_days=sum(1 for d in pto_set if start <= d <= end)
+            + sum(1 for d in float_set if start <= d <= end),
+            holidays=self._holiday_prefix[end + 1] - self._holiday_prefix[start],
+            weekend_days=self._weekend_prefix[end + 1] - self._weekend_prefix[start],
         )
 
     # ------------------------------------------------------------------
     # Strategies
     # ------------------------------------------------------------------
 
+    @_memoize_plan
     def optimize_max_bridges(self) -> Plan:
         """Maximize total vacation by bridging gaps between off-blocks.
 
         Value per off-day = streak position  →  block of length L contributes
         L*(L+1)/2, giving quadratic preference for longer blocks.
         """
-        pto, flt = self._solve_dp(value_fn=lambda _d, s: s)
+        pto, flt = self._solve_dp(value_fn=_streak_value)
         return self._make_plan(
             "Bridge Optimizer",
             "Maximizes total vacation days by bridging gaps between "
@@ -576,6 +684,7 @@ class PTOOptimizer:
             flt,
         )
 
+    @_memoize_plan
     def optimize_longest_vacation(self) -> Plan:
         """Concentrate PTO to create the single longest contiguous vacation.
 
@@ -584,30 +693,26 @@ class PTOOptimizer:
         """
         total_budget = self.pto_budget + self.floating_holidays
 
-        # Sliding window: find longest window where workdays <= budget
+        # Longest window where workdays <= budget, via a workday prefix sum:
+        # work_prefix[i] = workdays among days[:i].  For each right edge the
+        # smallest feasible left edge is a bisect on the monotone prefix.
+        work_prefix = list(
+            itertools.accumulate((not off for off in self.is_natural_off), initial=0)
+        )
         best_start = best_end = 0
         best_len = 0
-        workdays = 0
-        left = 0
 
         for right in range(self.num_days):
-            if not self.is_natural_off[right]:
-                workdays += 1
-            while workdays > total_budget:
-                if not self.is_natural_off[left]:
-                    workdays -= 1
-                left += 1
+            left = bisect.bisect_left(work_prefix, work_prefix[right + 1] - total_budget)
             if right - left + 1 > best_len:
                 best_len = right - left + 1
                 best_start = left
                 best_end = right
 
-        # Assign PTO within the best window
-        window = set(range(best_start, best_end + 1))
-
-        # DP with a large bonus for days in the target window
+        # DP with a large bonus for days in the target window — plain range
+        # comparisons, no per-call set hashing
         def value_fn(_d: int, s: int) -> float:
-            if _d in window:
+            if best_start <= _d <= best_end:
                 return 1000 + s  # overwhelming preference for the window
             return s  # remaining PTO used for bridges elsewhere
 
@@ -621,6 +726,7 @@ class PTOOptimizer:
             flt,
         )
 
+    @_memoize_plan
     def optimize_extended_weekends(self) -> Plan:
         """Spread PTO across many 3-4 day weekends.
 
@@ -628,12 +734,7 @@ class PTOOptimizer:
         many short getaways instead.
         """
 
-        def value_fn(_d: int, s: int) -> float:
-            if s <= 4:
-                return float(s)
-            return s - 10.0 * (s - 4)  # heavy penalty past 4 days
-
-        pto, flt = self._solve_dp(value_fn=value_fn)
+        pto, flt = self._solve_dp(value_fn=_extended_weekend_value)
 
         return self._make_plan(
             "Extended Weekends",
@@ -643,11 +744,13 @@ class PTOOptimizer:
             flt,
         )
 
+    @_memoize_plan
     def optimize_quarterly(self) -> Plan:
         """Distribute PTO across quarters for year-round breaks.
 
         Runs the bridge DP independently per quarter, then combines.
-        A small overlap at quarter boundaries handles cross-quarter bridges.
+        Quarters are solved in isolation, so PTO is never placed across
+        a quarter boundary.
         """
         quarter_bounds = [
             (datetime.date(self.year, 1, 1), datetime.date(self.year, 3, 31)),
@@ -675,12 +778,19 @@ class PTOOptimizer:
         all_pto: list[int] = []
         all_float: list[int] = []
 
+        is_pinned = self._is_pinned
+        natural_off = self.is_natural_off
+
         for qi, (qs, qe) in enumerate(quarter_bounds):
-            q_start_idx = (qs - self.start_date).days
-            q_end_idx = (qe - self.start_date).days
+            q_start_idx = qs.toordinal() - self._start_ord
+            q_end_idx = qe.toordinal() - self._start_ord
 
             q_budget = budgets[qi]
-            if q_budget == 0:
+            # A zero-budget quarter may still contain pinned must-take
+            # workdays; _solve_dp records those even with nothing to spend.
+            if q_budget == 0 and not any(
+                is_pinned[d] and not natural_off[d] for d in range(q_start_idx, q_end_idx + 1)
+            ):
                 continue
 
             # Decide PTO vs floating split for this quarter
@@ -688,21 +798,13 @@ class PTOOptimizer:
             pto_for_q = q_budget - max(0, float_for_q)
             float_for_q = max(0, float_for_q)
 
-            # DP restricted to this quarter's date range
-            def make_value_fn(start: int, end: int) -> ValueFn:
-                def vfn(d: int, s: int) -> float:
-                    if start <= d <= end:
-                        return float(s)
-                    return 0.0
-
-                return vfn
-
-            # Run full-year DP but only reward days in this quarter
-            # (PTO placed outside the quarter yields 0 value, so it won't be)
+            # DP restricted to this quarter's day range — a quarter-length
+            # solve instead of a full-year solve that rewards only 25% of it
             pto, flt = self._solve_dp(
-                value_fn=make_value_fn(q_start_idx, q_end_idx),
+                value_fn=_streak_value,
                 pto_budget=pto_for_q,
                 float_budget=float_for_q,
+                day_range=(q_start_idx, q_end_idx),
             )
             all_pto.extend(pto)
             all_float.extend(flt)
@@ -723,16 +825,10 @@ class PTOOptimizer:
     # ------------------------------------------------------------------
 
     def generate_all_plans(self) -> list[Plan]:
-        strategies = [
-            ("optimize_max_bridges", self.optimize_max_bridges),
-            ("optimize_longest_vacation", self.optimize_longest_vacation),
-            ("optimize_extended_weekends", self.optimize_extended_weekends),
-            ("optimize_quarterly", self.optimize_quarterly),
-        ]
         plans: list[Plan] = []
-        for name, func in strategies:
+        for name in _STRATEGY_METHODS:
             try:
-                plans.append(func())
+                plans.append(getattr(self, name)())
             except Exception as e:
                 print(f"  [Warning] Strategy '{name}' failed: {e}")
         return plans
@@ -760,21 +856,27 @@ class MultiGroupOptimizer:
         self.end_date = datetime.date(year, 12, 31)
         self.num_days = (self.end_date - self.start_date).days + 1
 
+        # Same ordinal-based date construction as PTOOptimizer
+        self._start_ord = self.start_date.toordinal()
         self.dates: list[datetime.date] = [
-            self.start_date + datetime.timedelta(days=d) for d in range(self.num_days)
+            datetime.date.fromordinal(self._start_ord + d) for d in range(self.num_days)
         ]
-        self.is_weekend: list[bool] = [d.weekday() >= 5 for d in self.dates]
+        # Same modular weekday sweep as PTOOptimizer
+        start_weekday = self.start_date.weekday()
+        self.is_weekend: list[bool] = [(start_weekday + d) % 7 >= 5 for d in range(self.num_days)]
 
         # Per-group precomputation
-        self.group_holiday_sets: list[set[datetime.date]] = []
+        self.group_holiday_sets: list[frozenset[datetime.date]] = []
         self.group_is_holiday: list[list[bool]] = []
         self.group_is_natural_off: list[list[bool]] = []
         self.group_budgets: list[int] = []
 
         for g in groups:
-            hset = set(g.holidays)
+            hset = frozenset(g.holidays)
             self.group_holiday_sets.append(hset)
-            is_hol = [d in hset for d in self.dates]
+            # Same integer-ordinal membership as PTOOptimizer
+            hol_ords = frozenset(h.toordinal() for h in hset)
+            is_hol = [(self._start_ord + d) in hol_ords for d in range(self.num_days)]
             self.group_is_holiday.append(is_hol)
             self.group_is_natural_off.append(
                 [w or h for w, h in zip(self.is_weekend, is_hol, strict=True)]
@@ -787,6 +889,30 @@ class MultiGroupOptimizer:
             for d in range(self.num_days)
         ]
 
+        # Per-day tuple of the groups that must spend PTO for a shared
+        # off-day (i.e. not naturally off that day) — the DP's spend loop
+        # iterates exactly the paying groups instead of testing all of them
+        self._pay_groups: list[tuple[int, ...]] = [
+            tuple(g for g in range(self.num_groups) if not self.group_is_natural_off[g][d])
+            for d in range(self.num_days)
+        ]
+
+        # Prefix sums for O(1) per-block counters (mirrors PTOOptimizer):
+        # a "shared holiday" is a non-weekend day that is a holiday for
+        # every group.
+        shared_holiday = [
+            not w and all(ih[d] for ih in self.group_is_holiday)
+            for d, w in enumerate(self.is_weekend)
+        ]
+        self._shared_holiday_prefix: list[int] = list(
+            itertools.accumulate(shared_holiday, initial=0)
+        )
+        self._weekend_prefix: list[int] = list(itertools.accumulate(self.is_weekend, initial=0))
+
+    def day_index(self, d: datetime.date) -> int:
+        """Index of *d* in :attr:`dates` (ordinal subtraction, no timedelta)."""
+        return d.toordinal() - self._start_ord
+
     # ------------------------------------------------------------------
     # Core DP solver (multi-group)
     # ------------------------------------------------------------------
@@ -795,6 +921,7 @@ class MultiGroupOptimizer:
         self,
         value_fn: ValueFn,
         budget_overrides: list[int] | None = None,
+        day_range: tuple[int, int] | None = None,
     ) -> list[list[int]]:
         """Find optimal shared PTO placement for all groups.
 
@@ -804,6 +931,9 @@ class MultiGroupOptimizer:
             Incremental reward for having a shared off-day.
         budget_overrides : list[int], optional
             Override the per-group total budgets (PTO + floating combined).
+        day_range : (first_day, last_day), optional
+            Restrict the DP to an inclusive day-index window, seeding the
+            entering streak with the preceding all-groups-off run.
 
         Returns
         -------
@@ -814,86 +944,112 @@ class MultiGroupOptimizer:
         num_days = self.num_days
         num_groups = self.num_groups
         all_nat = self.all_natural_off
-        g_nat = self.group_is_natural_off
+        pay_groups = self._pay_groups
         budgets_init = tuple(budget_overrides) if budget_overrides else tuple(self.group_budgets)
 
-        @cache
-        def dp(day: int, budgets: tuple[int, ...], streak: int) -> float:
-            if day >= num_days:
+        # Nothing to spend: every group keeps its natural off-days only.
+        if not any(budgets_init):
+            return [[] for _ in range(num_groups)]
+
+        first_day, last_day = day_range if day_range is not None else (0, num_days - 1)
+        start_streak = 0
+        i = first_day - 1
+        while i >= 0 and all_nat[i]:
+            start_streak += 1
+            i -= 1
+
+        # Pack the per-group remaining budgets into one int (a fixed-width
+        # field per group).  Spending a day for group g is a subtraction of
+        # unit[g]; no tuple is built per DP transition and memo keys hash a
+        # small int instead of a tuple of ints.
+        bits = max(1, max(budgets_init).bit_length())
+        unit = [1 << (bits * g) for g in range(num_groups)]
+        field_mask = (1 << bits) - 1
+        packed_init = sum(b << (bits * g) for g, b in enumerate(budgets_init))
+
+        # Explicit per-solve memo (same rationale as the single-group DP:
+        # nothing outlives the call, unlike a module-lifetime functools.cache),
+        # with the winning choice recorded per paid-day state for backtracking.
+        memo: dict[tuple[int, int, int], float] = {}
+        take_off: dict[tuple[int, int, int], bool] = {}
+
+        # Same free-run jump table as the single-group fast path: runs of
+        # all-groups-off days are consumed in one recursive call.
+        free_run_end: list[int] = [0] * (last_day + 2)
+        free_run_end[last_day + 1] = last_day + 1
+        for d in range(last_day, first_day - 1, -1):
+            free_run_end[d] = free_run_end[d + 1] if all_nat[d] else d
+
+        def spend(packed: int, day: int) -> int:
+            """Deduct one day from every group not naturally off on *day*.
+
+            Returns the new packed budgets, or -1 if some group is broke.
+            """
+            for g in pay_groups[day]:
+                if (packed >> (bits * g)) & field_mask:
+                    packed -= unit[g]
+                else:
+                    return -1
+            return packed
+
+        def dp(day: int, packed: int, streak: int) -> float:
+            if day > last_day:
                 return 0.0
+            key = (day, packed, streak)
+            cached = memo.get(key)
+            if cached is not None:
+                return cached
 
             if all_nat[day]:
-                ns = streak + 1
-                return value_fn(day, ns) + dp(day + 1, budgets, ns)
+                end = free_run_end[day]
+                val = dp(end, packed, streak + (end - day))
+                s = streak
+                for d2 in range(day, end):
+                    s += 1
+                    val += value_fn(d2, s)
+                memo[key] = val
+                return val
 
             # Not all naturally off — choose: work or take off
-            best = dp(day + 1, budgets, 0)  # work
+            best = dp(day + 1, packed, 0)  # work
+            off = False
 
             # Cost: each group not naturally off must spend 1
-            new_b = list(budgets)
-            can_afford = True
-            for g in range(num_groups):
-                if not g_nat[g][day]:
-                    if new_b[g] > 0:
-                        new_b[g] -= 1
-                    else:
-                        can_afford = False
-                        break
-
-            if can_afford:
+            new_packed = spend(packed, day)
+            if new_packed >= 0:
                 ns = streak + 1
-                v = value_fn(day, ns) + dp(day + 1, tuple(new_b), ns)
+                v = value_fn(day, ns) + dp(day + 1, new_packed, ns)
                 if v > best:
                     best = v
+                    off = True
 
+            memo[key] = best
+            take_off[key] = off
             return best
 
         # Forward pass
-        dp(0, budgets_init, 0)
+        dp(first_day, packed_init, start_streak)
 
-        # Backtrack
+        # Backtrack by replaying the recorded choices
         per_group: list[list[int]] = [[] for _ in range(num_groups)]
-        day, budgets_live, streak = 0, list(budgets_init), 0
+        day, packed_live, streak = first_day, packed_init, start_streak
 
-        while day < num_days:
+        while day <= last_day:
             if all_nat[day]:
                 streak += 1
                 day += 1
                 continue
 
-            work_val = dp(day + 1, tuple(budgets_live), 0)
-            best_val = work_val
-            action = "work"
-
-            new_b = list(budgets_live)
-            can_afford = True
-            for g in range(num_groups):
-                if not g_nat[g][day]:
-                    if new_b[g] > 0:
-                        new_b[g] -= 1
-                    else:
-                        can_afford = False
-                        break
-
-            if can_afford:
-                ns = streak + 1
-                v = value_fn(day, ns) + dp(day + 1, tuple(new_b), ns)
-                if v > best_val:
-                    best_val = v
-                    action = "off"
-
-            if action == "off":
-                for g in range(num_groups):
-                    if not g_nat[g][day]:
-                        per_group[g].append(day)
-                        budgets_live[g] -= 1
+            if take_off[(day, packed_live, streak)]:
+                for g in pay_groups[day]:
+                    per_group[g].append(day)
+                packed_live = spend(packed_live, day)
                 streak += 1
             else:
                 streak = 0
 
             day += 1
 
-        dp.cache_clear()
         return per_group
 
     # ------------------------------------------------------------------
@@ -906,30 +1062,29 @@ class MultiGroupOptimizer:
         description: str,
         per_group_pto: list[list[int]],
     ) -> MultiGroupPlan:
-        # All days that are off for everyone
-        off_set: set[int] = set()
-        for d in range(self.num_days):
-            if self.all_natural_off[d]:
-                off_set.add(d)
+        # Day-indexed off mask: copy the all-groups natural-off mask, then
+        # flip the chosen PTO days (same pattern as PTOOptimizer)
+        off_mask = self.all_natural_off.copy()
         all_pto_set: set[int] = set()
         for g_days in per_group_pto:
             all_pto_set.update(g_days)
-        off_set.update(all_pto_set)
+        for d in all_pto_set:
+            off_mask[d] = True
 
-        blocks = self._extract_blocks(off_set, all_pto_set)
+        blocks = self._extract_blocks(off_mask, all_pto_set)
 
         # Split per-group days into floating then PTO
+        dates = self.dates
         allocations: list[GroupAllocation] = []
-        for g in range(self.num_groups):
-            indices = per_group_pto[g]
-            fl_count = self.groups[g].floating_holidays
+        for grp, indices in zip(self.groups, per_group_pto, strict=True):
+            fl_count = grp.floating_holidays
             float_idx = indices[:fl_count]
             pto_idx = indices[fl_count:]
             allocations.append(
                 GroupAllocation(
-                    group_name=self.groups[g].name,
-                    pto_dates=[self.dates[i] for i in pto_idx],
-                    floating_dates=[self.dates[i] for i in float_idx],
+                    group_name=grp.name,
+                    pto_dates=[dates[i] for i in pto_idx],
+                    floating_dates=[dates[i] for i in float_idx],
                 )
             )
 
@@ -940,54 +1095,49 @@ class MultiGroupOptimizer:
             group_allocations=allocations,
         )
 
-    def _extract_blocks(self, off_set: set[int], pto_set: set[int]) -> list[VacationBlock]:
-        if not off_set:
-            return []
-
-        sorted_off = sorted(off_set)
+    def _extract_blocks(self, off_mask: list[bool], pto_set: set[int]) -> list[VacationBlock]:
+        # Single pass over the day-indexed mask — no sort, no successor
+        # checks (same technique as the single-group extractor)
         blocks: list[VacationBlock] = []
-        start = prev = sorted_off[0]
-
-        for d in sorted_off[1:]:
-            if d == prev + 1:
-                prev = d
-            else:
-                blk = self._make_block(start, prev, pto_set)
+        start: int | None = None
+
+        for d, off in enumerate(off_mask):
+            if off:
+                if start is None:
+                    start = d
+            elif start is not None:
+                blk = self._make_block(start, d - 1, pto_set)
                 if blk.pto_days > 0:
                     blocks.append(blk)
-                start = prev = d
+                start = None
 
-        blk = self._make_block(start, prev, pto_set)
-        if blk.pto_days > 0:
-            blocks.append(blk)
+        if start is not None:
+            blk = self._make_block(start, self.num_days - 1, pto_set)
+            if blk.pto_days > 0:
+                blocks.append(blk)
 
         return blocks
 
     def _make_block(self, start: int, end: int, pto_set: set[int]) -> VacationBlock:
-        rng = range(start, end + 1)
-        # "Shared holidays" = days that are a holiday for ALL groups (not weekend)
-        shared_holidays = sum(
-            1
-            for d in rng
-            if not self.is_weekend[d]
-            and all(self.group_is_holiday[g][d] for g in range(self.num_groups))
-        )
+        # Shared-holiday/weekend counts are prefix-sum differences; the PTO
+        # count walks the (budget-sized) index set rather than every day
         return VacationBlock(
             start_date=self.dates[start],
             end_date=self.dates[end],
             total_days=end - start + 1,
-            pto_days=sum(1 for d in rng if d in pto_set),
-            holidays=shared_holidays,
-            weekend_days=sum(1 for d in rng if self.is_weekend[d]),
+            pto_days=sum(1 for d in pto_set if start <= d <= end),
+            holidays=self._shared_holiday_prefix[end + 1] - self._shared_holiday_prefix[start],
+            weekend_days=self._weekend_prefix[end + 1] - self._weekend_prefix[start],
         )
 
     # ------------------------------------------------------------------
     # Strategies
     # ------------------------------------------------------------------
 
+    @_memoize_plan
     def optimize_max_bridges(self) -> MultiGroupPlan:
         """Maximize total shared vacation by bridging gaps."""
-        per_group = self._solve_dp(value_fn=lambda _d, s: s)
+        per_group = self._solve_dp(value_fn=_streak_value)
         return self._make_plan(
             "Bridge Optimizer (Multi-Group)",
             "Maximizes shared vacation days by bridging gaps between "
@@ -995,6 +1145,7 @@ class MultiGroupOptimizer:
             per_group,
         )
 
+    @_memoize_plan
     def optimize_longest_vacation(self) -> MultiGroupPlan:
         """Concentrate PTO to create the single longest shared vacation."""
         # Sliding window: find longest window where the *most constrained*
@@ -1003,31 +1154,29 @@ class MultiGroupOptimizer:
         best_start = best_end = 0
         best_len = 0
 
-        # Per-group workday counters in the sliding window
-        g_work = [0] * self.num_groups
-        left = 0
+        # Per-group workday prefix sums (same technique as the single-group
+        # search): for each right edge, a group's minimal feasible left edge
+        # is a bisect on its monotone prefix, and the window must satisfy
+        # the most constrained group — the max of those left edges.
+        work_prefix = [
+            list(
+                itertools.accumulate((not off for off in self.group_is_natural_off[g]), initial=0)
+            )
+            for g in range(self.num_groups)
+        ]
 
         for right in range(self.num_days):
-            for g in range(self.num_groups):
-                if not self.group_is_natural_off[g][right]:
-                    g_work[g] += 1
-
-            # Shrink until all groups can afford the window
-            while any(g_work[g] > self.group_budgets[g] for g in range(self.num_groups)):
-                for g in range(self.num_groups):
-                    if not self.group_is_natural_off[g][left]:
-                        g_work[g] -= 1
-                left += 1
-
+            left = max(
+                bisect.bisect_left(wp, wp[right + 1] - budget)
+                for wp, budget in zip(work_prefix, self.group_budgets, strict=True)
+            )
             if right - left + 1 > best_len:
                 best_len = right - left + 1
                 best_start = left
                 best_end = right
 
-        window = set(range(best_start, best_end + 1))
-
         def value_fn(_d: int, s: int) -> float:
-            if _d in window:
+            if best_start <= _d <= best_end:
                 return 1000 + s
             return s
 
@@ -1039,15 +1188,11 @@ class MultiGroupOptimizer:
             per_group,
         )
 
+    @_memoize_plan
     def optimize_extended_weekends(self) -> MultiGroupPlan:
         """Spread PTO across many short shared getaways."""
 
-        def value_fn(_d: int, s: int) -> float:
-            if s <= 4:
-                return float(s)
-            return s - 10.0 * (s - 4)
-
-        per_group = self._solve_dp(value_fn=value_fn)
+        per_group = self._solve_dp(value_fn=_extended_weekend_value)
         return self._make_plan(
             "Extended Weekends (Multi-Group)",
             "Spreads PTO across many 3-4 day shared weekends throughout "
@@ -1055,6 +1200,7 @@ class MultiGroupOptimizer:
             per_group,
         )
 
+    @_memoize_plan
     def optimize_quarterly(self) -> MultiGroupPlan:
         """Distribute shared PTO across quarters for year-round breaks."""
         quarter_bounds = [
@@ -1089,24 +1235,19 @@ class MultiGroupOptimizer:
         all_per_group: list[list[int]] = [[] for _ in range(self.num_groups)]
 
         for qi, (qs, qe) in enumerate(quarter_bounds):
-            q_start_idx = (qs - self.start_date).days
-            q_end_idx = (qe - self.start_date).days
+            q_start_idx = qs.toordinal() - self._start_ord
+            q_end_idx = qe.toordinal() - self._start_ord
 
             budgets_for_q = quarter_budgets[qi]
             if all(b == 0 for b in budgets_for_q):
                 continue
 
-            def make_value_fn(start: int, end: int) -> ValueFn:
-                def vfn(d: int, s: int) -> float:
-                    if start <= d <= end:
-                        return float(s)
-                    return 0.0
-
-                return vfn
-
+            # Quarter-length solve instead of a full-year one (see the
+            # single-group optimize_quarterly)
             per_group = self._solve_dp(
-                value_fn=make_value_fn(q_start_idx, q_end_idx),
+                value_fn=_streak_value,
                 budget_overrides=budgets_for_q,
+                day_range=(q_start_idx, q_end_idx),
             )
             for g in range(self.num_groups):
                 all_per_group[g].extend(per_group[g])
@@ -1126,16 +1267,10 @@ class MultiGroupOptimizer:
     # ------------------------------------------------------------------
 
     def generate_all_plans(self) -> list[MultiGroupPlan]:
-        strategies = [
-            ("optimize_max_bridges", self.optimize_max_bridges),
-            ("optimize_longest_vacation", self.optimize_longest_vacation),
-            ("optimize_extended_weekends", self.optimize_extended_weekends),
-            ("optimize_quarterly", self.optimize_quarterly),
-        ]
         plans: list[MultiGroupPlan] = []
-        for name, func in strategies:
+        for name in _STRATEGY_METHODS:
             try:
-                plans.append(func())
+                plans.append(getattr(self, name)())
             except Exception as e:
                 print(f"  [Warning] Strategy '{name}' failed: {e}")
         return plans
@@ -1145,19 +1280,76 @@ class MultiGroupOptimizer:
 # Output formatting
 # ---------------------------------------------------------------------------
 
+# Fixed rules/headers built once instead of per render
+_W = 64
+_HR = "=" * _W
+_SUB_HR = "  " + "-" * (_W - 4)
+_CAL_HEADER = "  Mo  Tu  We  Th  Fr  Sa  Su"
+# Leading blank cells for each possible first weekday of a month
+_LEAD_BLANKS = tuple("    " * i for i in range(7))
+
+
+# Snapshot the localized name sequences once; indexing a tuple is much
+# cheaper than strftime, which re-parses its format string per call.
+_DAY_ABBR = tuple(calendar.day_abbr)
+_DAY_NAME = tuple(calendar.day_name)
+_MONTH_ABBR = tuple(calendar.month_abbr)
+_MONTH_NAME = tuple(calendar.month_name)
+
+# Every possible calendar cell, precomputed per (classification code,
+# day-of-month): the per-day f-string becomes a table lookup.
+_CELLS = tuple(
+    tuple(f"  {day:>2}" if code == 0 else f" {day:>2}{'.PFH'[code]}" for day in range(32))
+    for code in range(4)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _block_parts(pto_days: int, holidays: int, weekend_days: int, shared: bool) -> str:
+    """Cached "N PTO + N holiday(s) + N weekend" block detail line.
+
+    Block compositions draw from a small domain (a few PTO days, 0-2
+    holidays, a handful of weekend days), so the same strings repeat
+    across blocks and plans.
+    """
+    parts: list[str] = []
+    if pto_days:
+        parts.append(f"{pto_days} PTO")
+    if holidays:
+        word = "shared holiday" if shared else "holiday"
+        parts.append(f"{holidays} {word}{'s' if holidays > 1 else ''}")
+    if weekend_days:
+        parts.append(f"{weekend_days} weekend")
+    return " + ".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _short_label(d: datetime.date) -> str:
+    """Cached label equivalent to ``strftime("%a, %b %d")``.
+
+    The same dates (holidays, block boundaries) recur across the four
+    rendered plans, so most calls are cache hits.
+    """
+    return f"{_DAY_ABBR[d.weekday()]}, {_MONTH_ABBR[d.month]} {d.day:02d}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _long_label(d: datetime.date) -> str:
+    """Cached label equivalent to ``strftime("%A, %B %d, %Y")``."""
+    return f"{_DAY_NAME[d.weekday()]}, {_MONTH_NAME[d.month]} {d.day:02d}, {d.year}"
+
 
 def format_plan(plan: Plan, optimizer: PTOOptimizer) -> str:
     """Return a human-readable summary of a vacation plan."""
     lines: list[str] = []
-    w = 64
 
     lines.append("")
-    lines.append("=" * w)
+    lines.append(_HR)
     lines.append(f"  OPTION: {plan.name}")
     lines.append(f"  {plan.description}")
-    lines.append("=" * w)
+    lines.append(_HR)
 
-    total_vacation = sum(b.total_days for b in plan.blocks)
+    total_vacation = plan.total_vacation_days
     total_pto = len(plan.pto_dates) + len(plan.floating_dates)
 
     budget_label = f"{optimizer.pto_budget}"
@@ -1174,60 +1366,63 @@ def format_plan(plan: Plan, optimizer: PTOOptimizer) -> str:
 
     # Vacation blocks
     lines.append("  Vacation Blocks:")
-    lines.append("  " + "-" * (w - 4))
+    lines.append(_SUB_HR)
 
     for i, block in enumerate(plan.blocks, 1):
         n = block.total_days
         day_word = "day" if n == 1 else "days"
         if block.start_date == block.end_date:
-            dr = block.start_date.strftime("%a, %b %d")
+            dr = _short_label(block.start_date)
         else:
-            dr = (
-                f"{block.start_date.strftime('%a, %b %d')} -> "
-                f"{block.end_date.strftime('%a, %b %d')}"
-            )
+            dr = f"{_short_label(block.start_date)} -> {_short_label(block.end_date)}"
         lines.append(f"  {i:>2}. {dr}  ({n} {day_word})")
 
-        parts: list[str] = []
-        if block.pto_days:
-            parts.append(f"{block.pto_days} PTO")
-        if block.holidays:
-            parts.append(f"{block.holidays} holiday{'s' if block.holidays > 1 else ''}")
-        if block.weekend_days:
-            parts.append(f"{block.weekend_days} weekend")
-        lines.append(f"      {' + '.join(parts)}")
+        lines.append(
+            f"      {_block_parts(block.pto_days, block.holidays, block.weekend_days, False)}"
+        )
         lines.append("")
 
     # Days to request off
     lines.append("  Days to request off:")
     for d in plan.pto_dates:
-        lines.append(f"    -> {d.strftime('%A, %B %d, %Y')}")
+        lines.append(f"    -> {_long_label(d)}")
     if plan.floating_dates:
         lines.append("")
         lines.append("  Floating holiday(s):")
         for d in plan.floating_dates:
-            lines.append(f"    -> {d.strftime('%A, %B %d, %Y')}")
+            lines.append(f"    -> {_long_label(d)}")
 
     return "\n".join(lines)
 
 
 def format_calendar_view(plan: Plan, optimizer: PTOOptimizer) -> str:
     """Return a month-by-month calendar highlighting PTO and holidays."""
-    pto_set = set(plan.pto_dates)
-    floating_set = set(plan.floating_dates)
     holiday_set = optimizer.holidays
     year = optimizer.year
 
-    # Determine which months to show (those with PTO or holidays)
-    active_months: set[int] = set()
-    for d in plan.pto_dates:
-        active_months.add(d.month)
-    for d in plan.floating_dates:
-        active_months.add(d.month)
+    # One classification byte per day of the year (0 = plain, 1 = PTO,
+    # 2 = floating, 3 = holiday) replaces three set-membership tests per
+    # calendar cell.  Later writes win, matching the old precedence
+    # (PTO > floating > holiday).
+    base = optimizer._start_ord
+    num_days = optimizer.num_days
+    codes = bytearray(num_days)
+    active_bits = 0
+    # Holidays may fall outside the plan year (e.g. an observed New
+    # Year's on Dec 31 of the prior year); skip those.
     for d in holiday_set:
-        active_months.add(d.month)
+        offset = d.toordinal() - base
+        if 0 <= offset < num_days:
+            codes[offset] = 3
+            active_bits |= 1 << d.month
+    for d in plan.floating_dates:
+        codes[d.toordinal() - base] = 2
+        active_bits |= 1 << d.month
+    for d in plan.pto_dates:
+        codes[d.toordinal() - base] = 1
+        active_bits |= 1 << d.month
 
-    if not active_months:
+    if not active_bits:
         return ""
 
     lines: list[str] = [
@@ -1237,36 +1432,25 @@ def format_calendar_view(plan: Plan, optimizer: PTOOptimizer) -> str:
         "",
     ]
 
-    cal = calendar.Calendar(firstweekday=0)
-
     for month in range(1, 13):
-        if month not in active_months:
+        if not (active_bits >> month) & 1:
             continue
 
-        lines.append(f"  {calendar.month_name[month]} {year}")
-        lines.append("  Mo  Tu  We  Th  Fr  Sa  Su")
-
-        row = ""
-        for day_num, weekday in cal.itermonthdays2(year, month):
-            if day_num == 0:
-                row += "    "
-            else:
-                d = datetime.date(year, month, day_num)
-                if d in pto_set:
-                    cell = f" {day_num:>2}P"
-                elif d in floating_set:
-                    cell = f" {day_num:>2}F"
-                elif d in holiday_set:
-                    cell = f" {day_num:>2}H"
-                else:
-                    cell = f"  {day_num:>2}"
-                row += cell
-
-            if weekday == 6:
+        lines.append(f"  {_MONTH_NAME[month]} {year}")
+        lines.append(_CAL_HEADER)
+
+        first_weekday, ndays = calendar.monthrange(year, month)
+        first_idx = datetime.date(year, month, 1).toordinal() - base
+        row = _LEAD_BLANKS[first_weekday]
+        weekday = first_weekday
+        for day_num in range(1, ndays + 1):
+            row += _CELLS[codes[first_idx + day_num - 1]][day_num]
+            weekday += 1
+            if weekday == 7:
                 lines.append(row)
                 row = ""
-
-        if row.strip():
+                weekday = 0
+        if row:
             lines.append(row)
         lines.append("")
 
@@ -1276,27 +1460,27 @@ def format_calendar_view(plan: Plan, optimizer: PTOOptimizer) -> str:
 def format_multi_group_plan(plan: MultiGroupPlan, optimizer: MultiGroupOptimizer) -> str:
     """Return a human-readable summary of a multi-group vacation plan."""
     lines: list[str] = []
-    w = 64
 
     lines.append("")
-    lines.append("=" * w)
+    lines.append(_HR)
     lines.append(f"  OPTION: {plan.name}")
     lines.append(f"  {plan.description}")
-    lines.append("=" * w)
+    lines.append(_HR)
 
     # Groups summary
     lines.append("")
     lines.append("  Groups:")
+    total_pto = 0
     for g, grp in enumerate(optimizer.groups):
         alloc = plan.group_allocations[g]
         used = len(alloc.pto_dates) + len(alloc.floating_dates)
+        total_pto += used
         budget_label = f"{grp.pto_budget}"
         if grp.floating_holidays:
             budget_label += f" + {grp.floating_holidays} floating"
         lines.append(f"    {grp.name}: {used} / {budget_label} PTO used")
 
-    total_vacation = sum(b.total_days for b in plan.blocks)
-    total_pto = sum(len(a.pto_dates) + len(a.floating_dates) for a in plan.group_allocations)
+    total_vacation = plan.total_vacation_days
     lines.append("")
     lines.append(f"  Total shared vacation days: {total_vacation}")
     lines.append(f"  Total PTO spent (all groups): {total_pto}")
@@ -1309,28 +1493,20 @@ def format_multi_group_plan(plan: MultiGroupPlan, optimizer: MultiGroupOptimizer
 
     # Vacation blocks
     lines.append("  Vacation Blocks:")
-    lines.append("  " + "-" * (w - 4))
+    lines.append(_SUB_HR)
 
     for i, block in enumerate(plan.blocks, 1):
         n = block.total_days
         day_word = "day" if n == 1 else "days"
         if block.start_date == block.end_date:
-            dr = block.start_date.strftime("%a, %b %d")
+            dr = _short_label(block.start_date)
         else:
-            dr = (
-                f"{block.start_date.strftime('%a, %b %d')} -> "
-                f"{block.end_date.strftime('%a, %b %d')}"
-            )
+            dr = f"{_short_label(block.start_date)} -> {_short_label(block.end_date)}"
         lines.append(f"  {i:>2}. {dr}  ({n} {day_word})")
 
-        parts: list[str] = []
-        if block.pto_days:
-            parts.append(f"{block.pto_days} PTO")
-        if block.holidays:
-            parts.append(f"{block.holidays} shared holiday{'s' if block.holidays > 1 else ''}")
-        if block.weekend_days:
-            parts.append(f"{block.weekend_days} weekend")
-        lines.append(f"      {' + '.join(parts)}")
+        lines.append(
+            f"      {_block_parts(block.pto_days, block.holidays, block.weekend_days, True)}"
+        )
         lines.append("")
 
     # Per-group days to request off
@@ -1339,11 +1515,11 @@ def format_multi_group_plan(plan: MultiGroupPlan, optimizer: MultiGroupOptimizer
         lines.append(f"  Days to request off — {grp.name}:")
         if alloc.pto_dates:
             for d in alloc.pto_dates:
-                lines.append(f"    -> {d.strftime('%A, %B %d, %Y')}")
+                lines.append(f"    -> {_long_label(d)}")
         if alloc.floating_dates:
             lines.append("    Floating holiday(s):")
             for d in alloc.floating_dates:
-                lines.append(f"      -> {d.strftime('%A, %B %d, %Y')}")
+                lines.append(f"      -> {_long_label(d)}")
         if not alloc.pto_dates and not alloc.floating_dates:
             lines.append("    (no PTO needed)")
         lines.append("")
@@ -1355,25 +1531,35 @@ def format_multi_group_calendar_view(plan: MultiGroupPlan, optimizer: MultiGroup
     """Return a month-by-month calendar for a multi-group plan."""
     year = optimizer.year
 
-    # Collect all notable dates
-    all_pto: set[datetime.date] = set()
-    all_floating: set[datetime.date] = set()
-    all_holidays: set[datetime.date] = set()
-    for alloc in plan.group_allocations:
-        all_pto.update(alloc.pto_dates)
-        all_floating.update(alloc.floating_dates)
-    for hset in optimizer.group_holiday_sets:
-        all_holidays.update(hset)
-
-    active_months: set[int] = set()
-    for d in all_pto:
-        active_months.add(d.month)
-    for d in all_floating:
-        active_months.add(d.month)
+    # Collect all notable dates in one hashing pass per category
+    all_pto = frozenset(itertools.chain.from_iterable(a.pto_dates for a in plan.group_allocations))
+    all_floating = frozenset(
+        itertools.chain.from_iterable(a.floating_dates for a in plan.group_allocations)
+    )
+    all_holidays = frozenset(itertools.chain.from_iterable(optimizer.group_holiday_sets))
+
+    # Same per-day classification table as format_calendar_view; the
+    # active-month bitmask is accumulated in the same pass instead of
+    # re-walking the three collections into a set.
+    base = optimizer._start_ord
+    num_days = optimizer.num_days
+    codes = bytearray(num_days)
+    active_bits = 0
+    # Holidays may fall outside the plan year (e.g. an observed New
+    # Year's on Dec 31 of the prior year); skip those.
     for d in all_holidays:
-        active_months.add(d.month)
+        offset = d.toordinal() - base
+        if 0 <= offset < num_days:
+            codes[offset] = 3
+            active_bits |= 1 << d.month
+    for d in all_floating:
+        codes[d.toordinal() - base] = 2
+        active_bits |= 1 << d.month
+    for d in all_pto:
+        codes[d.toordinal() - base] = 1
+        active_bits |= 1 << d.month
 
-    if not active_months:
+    if not active_bits:
         return ""
 
     lines: list[str] = [
@@ -1383,36 +1569,25 @@ def format_multi_group_calendar_view(plan: MultiGroupPlan, optimizer: MultiGroup
         "",
     ]
 
-    cal = calendar.Calendar(firstweekday=0)
-
     for month in range(1, 13):
-        if month not in active_months:
+        if not (active_bits >> month) & 1:
             continue
 
-        lines.append(f"  {calendar.month_name[month]} {year}")
-        lines.append("  Mo  Tu  We  Th  Fr  Sa  Su")
-
-        row = ""
-        for day_num, weekday in cal.itermonthdays2(year, month):
-            if day_num == 0:
-                row += "    "
-            else:
-                d = datetime.date(year, month, day_num)
-                if d in all_pto:
-                    cell = f" {day_num:>2}P"
-                elif d in all_floating:
-                    cell = f" {day_num:>2}F"
-                elif d in all_holidays:
-                    cell = f" {day_num:>2}H"
-                else:
-                    cell = f"  {day_num:>2}"
-                row += cell
-
-            if weekday == 6:
+        lines.append(f"  {_MONTH_NAME[month]} {year}")
+        lines.append(_CAL_HEADER)
+
+        first_weekday, ndays = calendar.monthrange(year, month)
+        first_idx = datetime.date(year, month, 1).toordinal() - base
+        row = _LEAD_BLANKS[first_weekday]
+        weekday = first_weekday
+        for day_num in range(1, ndays + 1):
+            row += _CELLS[codes[first_idx + day_num - 1]][day_num]
+            weekday += 1
+            if weekday == 7:
                 lines.append(row)
                 row = ""
-
-        if row.strip():
+                weekday = 0
+        if row:
             lines.append(row)
         lines.append("")
 
@@ -1458,30 +1633,30 @@ def main() -> None:
     }
     # =====================================================================
 
-    w = 64
-    print("=" * w)
-    print("  PTO VACATION OPTIMIZER")
-    print("=" * w)
-    print(f"  Year:              {year}")
-    print(f"  PTO budget:        {pto_budget} days")
-    print(f"  Floating holidays: {floating_holidays}")
-    print(f"  Company holidays:  {len(holidays)}")
-    print()
+    # Collect everything and write once: one flush, one stdout lock
+    out: list[str] = [
+        _HR,
+        "  PTO VACATION OPTIMIZER",
+        _HR,
+        f"  Year:              {year}",
+        f"  PTO budget:        {pto_budget} days",
+        f"  Floating holidays: {floating_holidays}",
+        f"  Company holidays:  {len(holidays)}",
+        "",
+    ]
     for h in holidays:
         name = holiday_names.get((h.month, h.day), "Holiday")
-        print(f"    {h.strftime('%a, %b %d'):>12}  {name}")
+        out.append(f"    {_short_label(h):>12}  {name}")
 
     optimizer = PTOOptimizer(year, pto_budget, holidays, floating_holidays)
     plans = optimizer.generate_all_plans()
 
     for plan in plans:
-        print(format_plan(plan, optimizer))
-        print(format_calendar_view(plan, optimizer))
+        out.append(format_plan(plan, optimizer))
+        out.append(format_calendar_view(plan, optimizer))
 
-    print()
-    print("=" * w)
-    print(f"  Generated {len(plans)} vacation plan options.")
-    print("=" * w)
+    out.extend(["", _HR, f"  Generated {len(plans)} vacation plan options.", _HR, ""])
+    sys.stdout.write("\n".join(out))
 
 
 if __name__ == "__main__":
@@ -316,6 +316,39 @@ class TestMultiGroupOptimize:
         finally:
             os.unlink(path)
 
+    def test_config_json_inline(self) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "optimize",
+                "--config-json",
+                json.dumps(self._basic_config()),
+                "--strategy",
+                "bridges",
+                "--no-calendar",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Multi-Group" in result.output
+        assert "Alice" in result.output
+
+    def test_config_json_invalid(self) -> None:
+        result = runner.invoke(app, ["optimize", "--config-json", "not json{{{"])
+        assert result.exit_code == 1
+        assert "Invalid JSON" in result.output
+
+    def test_config_json_conflicts_with_config(self) -> None:
+        path = _write_config(self._basic_config())
+        try:
+            result = runner.invoke(
+                app,
+                ["optimize", "--config", path, "--config-json", "{}"],
+            )
+            assert result.exit_code == 1
+            assert "not both" in result.output
+        finally:
+            os.unlink(path)
+
     def test_config_empty_groups(self) -> None:
         path = _write_config({"groups": []})
         try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 
 from pto.optimizer import (
     HolidayGroup,
@@ -12,21 +13,26 @@ from pto.optimizer import (
     format_plan,
 )
 
+_US_HOLIDAYS_2025: tuple[datetime.date, ...] = (
+    datetime.date(2025, 1, 1),
+    datetime.date(2025, 1, 20),
+    datetime.date(2025, 2, 17),
+    datetime.date(2025, 5, 26),
+    datetime.date(2025, 6, 19),
+    datetime.date(2025, 7, 4),
+    datetime.date(2025, 9, 1),
+    datetime.date(2025, 11, 27),
+    datetime.date(2025, 12, 25),
+)
+
 
 def _us_holidays_2025() -> list[datetime.date]:
-    return [
-        datetime.date(2025, 1, 1),
-        datetime.date(2025, 1, 20),
-        datetime.date(2025, 2, 17),
-        datetime.date(2025, 5, 26),
-        datetime.date(2025, 6, 19),
-        datetime.date(2025, 7, 4),
-        datetime.date(2025, 9, 1),
-        datetime.date(2025, 11, 27),
-        datetime.date(2025, 12, 25),
-    ]
+    return list(_US_HOLIDAYS_2025)
 
 
+# The optimizers are immutable once built (strategy results are memoized
+# per instance), so tests with the same configuration can share one.
+@functools.cache
 def _make_optimizer(
     pto_budget: int = 15,
     floating_holidays: int = 1,
@@ -49,24 +55,24 @@ class TestPTOOptimizerInit:
     def test_weekends_detected(self) -> None:
         opt = _make_optimizer()
         # Jan 4 2025 is a Saturday
-        idx = (datetime.date(2025, 1, 4) - opt.start_date).days
+        idx = opt.day_index(datetime.date(2025, 1, 4))
         assert opt.is_weekend[idx] is True
         # Jan 6 2025 is a Monday
-        idx = (datetime.date(2025, 1, 6) - opt.start_date).days
+        idx = opt.day_index(datetime.date(2025, 1, 6))
         assert opt.is_weekend[idx] is False
 
     def test_holidays_detected(self) -> None:
         opt = _make_optimizer()
-        idx = (datetime.date(2025, 7, 4) - opt.start_date).days
+        idx = opt.day_index(datetime.date(2025, 7, 4))
         assert opt.is_holiday[idx] is True
 
     def test_natural_off_combines_weekends_and_holidays(self) -> None:
         opt = _make_optimizer()
         # Saturday
-        sat_idx = (datetime.date(2025, 1, 4) - opt.start_date).days
+        sat_idx = opt.day_index(datetime.date(2025, 1, 4))
         assert opt.is_natural_off[sat_idx] is True
         # Holiday on a weekday
-        mlk_idx = (datetime.date(2025, 1, 20) - opt.start_date).days
+        mlk_idx = opt.day_index(datetime.date(2025, 1, 20))
         assert opt.is_natural_off[mlk_idx] is True
 
 
@@ -97,7 +103,7 @@ class TestStrategies:
         """Total vacation days should exceed PTO days used (bridging effect)."""
         opt = _make_optimizer(pto_budget=10, floating_holidays=0)
         plan = opt.optimize_max_bridges()
-        total_vacation = sum(b.total_days for b in plan.blocks)
+        total_vacation = plan.total_vacation_days
         assert total_vacation > 10
 
     def test_floating_holidays_assigned(self) -> None:
@@ -247,7 +253,7 @@ class TestMaxBlockDays:
             holidays=_us_holidays_2025(),
         )
         plan = opt.optimize_max_bridges()
-        longest = max(b.total_days for b in plan.blocks)
+        longest = plan.longest_block_days
         assert longest >= 7  # unrestricted should produce long blocks
 
     def test_uses_full_budget(self) -> None:
@@ -423,6 +429,7 @@ def _us_holidays_2025_dates() -> list[datetime.date]:
     return _us_holidays_2025()
 
 
+@functools.cache
 def _make_two_groups(
     budget_a: int = 15,
     budget_b: int = 12,
@@ -456,10 +463,10 @@ class TestMultiGroupInit:
         """A day is all-natural-off only if EVERY group has it off."""
         opt = _make_two_groups()
         # Thanksgiving 2025 is Nov 27 — both groups have it
-        idx = (datetime.date(2025, 11, 27) - opt.start_date).days
+        idx = opt.day_index(datetime.date(2025, 11, 27))
         assert opt.all_natural_off[idx] is True
         # Black Friday Nov 28 — only Bob has it, Alice doesn't
-        idx = (datetime.date(2025, 11, 28) - opt.start_date).days
+        idx = opt.day_index(datetime.date(2025, 11, 28))
         assert opt.all_natural_off[idx] is False
 
     def test_requires_at_least_one_group(self) -> None:
@@ -480,7 +487,7 @@ class TestMultiGroupStrategies:
     def test_bridge_vacation_exceeds_pto(self) -> None:
         opt = _make_two_groups(budget_a=10, budget_b=10)
         plan = opt.optimize_max_bridges()
-        total_vacation = sum(b.total_days for b in plan.blocks)
+        total_vacation = plan.total_vacation_days
         # Should leverage bridging effect
         assert total_vacation > 10
 
@@ -488,7 +495,7 @@ class TestMultiGroupStrategies:
         opt = _make_two_groups(budget_a=10, budget_b=10)
         plan = opt.optimize_longest_vacation()
         assert len(plan.blocks) >= 1
-        longest = max(b.total_days for b in plan.blocks)
+        longest = plan.longest_block_days
         assert longest >= 10
 
     def test_extended_weekends_no_very_long_blocks(self) -> None:
@@ -548,7 +555,7 @@ class TestMultiGroupStrategies:
             ],
         )
         same_plan = same.optimize_max_bridges()
-        same_vac = sum(b.total_days for b in same_plan.blocks)
+        same_vac = same_plan.total_vacation_days
 
         # Different holidays — harder to align
         diff = MultiGroupOptimizer(
@@ -559,7 +566,7 @@ class TestMultiGroupStrategies:
             ],
         )
         diff_plan = diff.optimize_max_bridges()
-        diff_vac = sum(b.total_days for b in diff_plan.blocks)
+        diff_vac = diff_plan.total_vacation_days
 
         # With no holidays for B, shared vacation should be ≤ same-holiday case
         assert diff_vac <= same_vac